@@ -7,31 +7,120 @@ Trains a Random Forest classifier to detect vehicle overload conditions
 # Import Statements
 # ============================================
 import numpy as np
-import pandas as pd
-from sklearn.model_selection import train_test_split
+
+# Use Intel's accelerated scikit-learn implementations when available
+try:
+    from sklearnex import patch_sklearn
+    patch_sklearn()
+except ImportError:
+    pass
+
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, classification_report, confusion_matrix
+from sklearn.metrics import classification_report, confusion_matrix
 import joblib
+from joblib import Parallel, delayed
 import json
 import os
 from datetime import datetime
 
+# ONNX export and inference are optional
+try:
+    from skl2onnx import to_onnx
+    from skl2onnx.common.exceptions import MissingConverter, MissingShapeCalculator
+except ImportError:
+    to_onnx = None
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+# Native code generation for the trained model is optional
+try:
+    import m2cgen as m2c
+except ImportError:
+    m2c = None
+
+# LZ4 compression for saved artifacts is optional; fall back to zlib without it
+try:
+    import lz4  # noqa: F401
+    ARTIFACT_COMPRESSION = ('lz4', 3)
+except ImportError:
+    ARTIFACT_COMPRESSION = ('zlib', 3)
+
 # ============================================
 # Configuration
 # ============================================
 RANDOM_STATE = 42
 N_SAMPLES = 1000
 TEST_SIZE = 0.2
+N_ESTIMATORS = 50
+N_SUBFORESTS = 10  # Fixed tree chunks, so the forest does not depend on the core count
+MAX_DEPTH = 10
+MAX_FEATURES = 'sqrt'
 MODEL_FILE = 'vehicle_overload_model.pkl'
 SCALER_FILE = 'scaler.pkl'
+ONNX_MODEL_FILE = 'vehicle_overload_model.onnx'
+C_MODEL_FILE = 'vehicle_overload_model.c'
 CONFIG_FILE = 'model_config.json'
+VERBOSE = os.environ.get('VERBOSE', '').lower() in ('1', 'true', 'yes')
+FEATURE_NAMES = ['current_load', 'max_load', 'load_ratio', 'suspension',
+                 'tire_pressure', 'weight', 'speed']
+
+# Column indices into feature arrays, in FEATURE_NAMES order
+(CURRENT_LOAD_COL, MAX_LOAD_COL, LOAD_RATIO_COL, SUSPENSION_COL,
+ TIRE_PRESSURE_COL, WEIGHT_COL, SPEED_COL) = range(len(FEATURE_NAMES))
+
+# Uniform sampling bounds (low, high) per feature, in FEATURE_NAMES order.
+# Derived columns are placeholders that get overwritten after sampling.
+NORMAL_FEATURE_BOUNDS = np.array([
+    (2.0, 8.0),       # current_load: less than max
+    (10.0, 15.0),     # max_load
+    (0.0, 0.0),       # load_ratio: derived
+    (70, 100),        # suspension: good
+    (28, 35),         # tire_pressure: normal
+    (3000, 8000),     # weight
+    (30, 80)          # speed: moderate
+], dtype=np.float32)
+
+OVERLOADED_FEATURE_BOUNDS = np.array([
+    (0.0, 0.0),       # current_load: derived
+    (10.0, 15.0),     # max_load
+    (105, 160),       # load_ratio: over 100%
+    (20, 60),         # suspension: bad
+    (20, 45),         # tire_pressure: abnormal
+    (5000, 10000),    # weight
+    (50, 120)         # speed: higher
+], dtype=np.float32)
 
 # ============================================
 # Data Generation Functions
 # ============================================
 
-def generate_normal_vehicle_data(n_samples=500):
+def sample_uniform_features(rng, n_samples, bounds):
+    """
+    Draw all feature columns from uniform distributions in one call
+    
+    Parameters:
+    -----------
+    rng : numpy.random.Generator
+        Random number generator
+    n_samples : int
+        Number of samples to generate
+    bounds : ndarray of shape (n_features, 2)
+        (low, high) bounds per feature column
+        
+    Returns:
+    --------
+    ndarray of shape (n_samples, n_features) with float32 features
+    """
+    X = rng.random((n_samples, len(bounds)), dtype=np.float32)
+    X *= bounds[:, 1] - bounds[:, 0]
+    X += bounds[:, 0]
+    return X
+
+def generate_normal_vehicle_data(n_samples=500, rng=None):
     """
     Generate synthetic data for normal (non-overloaded) vehicles
     
@@ -39,39 +128,31 @@ def generate_normal_vehicle_data(n_samples=500):
     -----------
     n_samples : int
         Number of samples to generate
+    rng : numpy.random.Generator, optional
+        Random number generator; seeded with RANDOM_STATE if not given
         
     Returns:
     --------
-    DataFrame with vehicle features
+    tuple : (X, y) with float32 features in FEATURE_NAMES order and int8 labels
     """
     print(f"Generating {n_samples} normal vehicle samples...")
     
-    np.random.seed(RANDOM_STATE)
-    
-    data = {
-        'current_load': np.random.uniform(2.0, 8.0, n_samples),  # Load less than max
-        'max_load': np.random.uniform(10.0, 15.0, n_samples),
-        'suspension': np.random.uniform(70, 100, n_samples),  # Good suspension
-        'tire_pressure': np.random.uniform(28, 35, n_samples),  # Normal pressure
-        'weight': np.random.uniform(3000, 8000, n_samples),
-        'speed': np.random.uniform(30, 80, n_samples)  # Moderate speed
-    }
+    if rng is None:
+        rng = np.random.default_rng(RANDOM_STATE)
     
-    df = pd.DataFrame(data)
+    X = sample_uniform_features(rng, n_samples, NORMAL_FEATURE_BOUNDS)
     
-    # Calculate load_ratio
-    df['load_ratio'] = (df['current_load'] / df['max_load']) * 100
+    # Calculate load_ratio in place; current_load <= 8 and max_load >= 10
+    # keep it at or below 80%, so no clipping is needed for normal vehicles
+    np.divide(X[:, CURRENT_LOAD_COL], X[:, MAX_LOAD_COL], out=X[:, LOAD_RATIO_COL])
+    X[:, LOAD_RATIO_COL] *= 100
     
-    # Ensure load_ratio is less than 100 for normal vehicles
-    df['load_ratio'] = df['load_ratio'].clip(upper=95)
-    df['current_load'] = df['load_ratio'] * df['max_load'] / 100
+    # Label: 0 for normal (not overloaded)
+    y = np.zeros(n_samples, dtype=np.int8)
     
-    # Add label: 0 for normal (not overloaded)
-    df['is_overloaded'] = 0
-    
-    return df
+    return X, y
 
-def generate_overloaded_vehicle_data(n_samples=500):
+def generate_overloaded_vehicle_data(n_samples=500, rng=None):
     """
     Generate synthetic data for overloaded vehicles
     
@@ -79,37 +160,31 @@ def generate_overloaded_vehicle_data(n_samples=500):
     -----------
     n_samples : int
         Number of samples to generate
+    rng : numpy.random.Generator, optional
+        Random number generator; seeded with RANDOM_STATE if not given
         
     Returns:
     --------
-    DataFrame with vehicle features
+    tuple : (X, y) with float32 features in FEATURE_NAMES order and int8 labels
     """
     print(f"Generating {n_samples} overloaded vehicle samples...")
     
-    np.random.seed(RANDOM_STATE + 1)
+    if rng is None:
+        rng = np.random.default_rng(RANDOM_STATE)
     
-    data = {
-        'max_load': np.random.uniform(10.0, 15.0, n_samples),
-        'suspension': np.random.uniform(20, 60, n_samples),  # Bad suspension
-        'tire_pressure': np.random.uniform(20, 45, n_samples),  # Abnormal pressure
-        'weight': np.random.uniform(5000, 10000, n_samples),
-        'speed': np.random.uniform(50, 120, n_samples)  # Higher speed
-    }
-    
-    df = pd.DataFrame(data)
-    
-    # Calculate load_ratio (over 100% for overloaded vehicles)
-    df['load_ratio'] = np.random.uniform(105, 160, n_samples)
+    # load_ratio is sampled directly (over 100% for overloaded vehicles)
+    X = sample_uniform_features(rng, n_samples, OVERLOADED_FEATURE_BOUNDS)
     
     # Calculate current_load based on load_ratio
-    df['current_load'] = (df['load_ratio'] / 100) * df['max_load']
+    np.multiply(X[:, LOAD_RATIO_COL], X[:, MAX_LOAD_COL], out=X[:, CURRENT_LOAD_COL])
+    X[:, CURRENT_LOAD_COL] *= 0.01
     
-    # Add label: 1 for overloaded
-    df['is_overloaded'] = 1
+    # Label: 1 for overloaded
+    y = np.ones(n_samples, dtype=np.int8)
     
-    return df
+    return X, y
 
-def create_synthetic_dataset(n_samples=1000):
+def create_synthetic_dataset(n_samples=1000, rng=None):
     """
     Create synthetic training dataset with balanced classes
     
@@ -117,10 +192,14 @@ def create_synthetic_dataset(n_samples=1000):
     -----------
     n_samples : int
         Total number of samples to generate
+    rng : numpy.random.Generator, optional
+        Random number generator shared by all generation steps; seeded with
+        RANDOM_STATE if not given
         
     Returns:
     --------
-    DataFrame with features and labels
+    tuple : (X, y) with float32 features in FEATURE_NAMES order and int8 labels,
+        normal vehicles first followed by overloaded vehicles
     """
     print("=" * 60)
     print("Creating Synthetic Training Dataset")
@@ -130,36 +209,45 @@ def create_synthetic_dataset(n_samples=1000):
     n_normal = n_samples // 2
     n_overloaded = n_samples - n_normal
     
-    normal_df = generate_normal_vehicle_data(n_normal)
-    overloaded_df = generate_overloaded_vehicle_data(n_overloaded)
+    if rng is None:
+        rng = np.random.default_rng(RANDOM_STATE)
     
-    # Combine datasets
-    df = pd.concat([normal_df, overloaded_df], ignore_index=True)
+    X_normal, y_normal = generate_normal_vehicle_data(n_normal, rng)
+    X_overloaded, y_overloaded = generate_overloaded_vehicle_data(n_overloaded, rng)
     
-    # Shuffle the dataset
-    df = df.sample(frac=1, random_state=RANDOM_STATE).reset_index(drop=True)
+    # Combine datasets; class blocks stay contiguous so they can be split
+    # per class without a stratifier (see balanced_split)
+    X = np.concatenate([X_normal, X_overloaded], axis=0)
+    y = np.concatenate([y_normal, y_overloaded])
     
     print(f"\nDataset created successfully!")
-    print(f"Total samples: {len(df)}")
-    print(f"Normal vehicles: {len(df[df['is_overloaded'] == 0])}")
-    print(f"Overloaded vehicles: {len(df[df['is_overloaded'] == 1])}")
-    print(f"\nDataset statistics:")
-    print(df.describe())
-    
-    return df
+    print(f"Total samples: {len(y)}")
+    print(f"Normal vehicles: {np.count_nonzero(y == 0)}")
+    print(f"Overloaded vehicles: {np.count_nonzero(y == 1)}")
+    
+    if VERBOSE:
+        print(f"\nDataset statistics:")
+        print(f"  {'feature':<14} {'mean':>10} {'std':>10} {'min':>10} {'max':>10}")
+        for name, mean, std, low, high in zip(FEATURE_NAMES, X.mean(axis=0), X.std(axis=0),
+                                              X.min(axis=0), X.max(axis=0)):
+            print(f"  {name:<14} {mean:10.2f} {std:10.2f} {low:10.2f} {high:10.2f}")
+    
+    return X, y
 
 # ============================================
 # Data Validation
 # ============================================
 
-def validate_data(df):
+def validate_data(X, y):
     """
     Validate the dataset for training
     
     Parameters:
     -----------
-    df : DataFrame
-        Dataset to validate
+    X : ndarray of shape (n_samples, n_features)
+        Features in FEATURE_NAMES order
+    y : ndarray of shape (n_samples,)
+        Labels
         
     Returns:
     --------
@@ -168,49 +256,170 @@ def validate_data(df):
     print("\nValidating dataset...")
     
     # Check for required columns
-    required_columns = ['current_load', 'max_load', 'load_ratio', 'suspension', 
-                       'tire_pressure', 'weight', 'speed', 'is_overloaded']
-    
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {missing_columns}")
+    if X.ndim != 2 or X.shape[1] != len(FEATURE_NAMES):
+        raise ValueError(f"Expected {len(FEATURE_NAMES)} feature columns {FEATURE_NAMES}, got shape {X.shape}")
     
-    # Check for null values
-    if df.isnull().any().any():
-        null_counts = df.isnull().sum()
-        raise ValueError(f"Dataset contains null values:\n{null_counts[null_counts > 0]}")
+    if y.shape != (X.shape[0],):
+        raise ValueError(f"Labels shape {y.shape} does not match {X.shape[0]} samples")
     
-    # Check for infinite values
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    if np.isinf(df[numeric_cols]).any().any():
-        raise ValueError("Dataset contains infinite values")
+    # Check for null and infinite values in a single pass
+    if not np.isfinite(X).all():
+        bad_counts = (~np.isfinite(X)).sum(axis=0)
+        bad_columns = {name: int(count) for name, count in zip(FEATURE_NAMES, bad_counts) if count}
+        raise ValueError(f"Dataset contains null or infinite values: {bad_columns}")
     
     # Check data ranges
-    if (df['suspension'] < 0).any() or (df['suspension'] > 100).any():
+    suspension = X[:, SUSPENSION_COL]
+    if suspension.min() < 0 or suspension.max() > 100:
         raise ValueError("Suspension values must be between 0 and 100")
     
-    if (df['tire_pressure'] < 0).any() or (df['tire_pressure'] > 100).any():
+    tire_pressure = X[:, TIRE_PRESSURE_COL]
+    if tire_pressure.min() < 0 or tire_pressure.max() > 100:
         raise ValueError("Tire pressure values must be positive")
     
-    if (df['current_load'] < 0).any() or (df['max_load'] < 0).any():
+    if X[:, CURRENT_LOAD_COL].min() < 0 or X[:, MAX_LOAD_COL].min() < 0:
         raise ValueError("Load values must be positive")
     
     # Check label distribution
-    label_counts = df['is_overloaded'].value_counts()
-    if len(label_counts) < 2:
+    if not ((y == 0).any() and (y == 1).any()):
         raise ValueError("Dataset must contain both classes (0 and 1)")
     
     print("✓ Dataset validation passed!")
     return True
 
+# ============================================
+# Data Splitting
+# ============================================
+
+def balanced_split(y, n_normal, test_size, rng):
+    """
+    Split a class-ordered dataset into train and test indices per class
+    
+    Parameters:
+    -----------
+    y : ndarray
+        Labels, with all normal samples (0) before all overloaded samples (1)
+    n_normal : int
+        Number of normal samples
+    test_size : float
+        Fraction of each class to hold out for testing
+    rng : numpy.random.Generator
+        Random number generator used to shuffle each class
+        
+    Returns:
+    --------
+    tuple : (train_idx, test_idx) index arrays into the dataset
+    """
+    if not ((y[:n_normal] == 0).all() and (y[n_normal:] == 1).all()):
+        raise ValueError("Labels must be ordered as a block of normal samples followed by overloaded samples")
+    
+    n_overloaded = len(y) - n_normal
+    train_parts = []
+    test_parts = []
+    
+    for offset, n_class in ((0, n_normal), (n_normal, n_overloaded)):
+        order = rng.permutation(n_class) + offset
+        n_test = int(np.ceil(test_size * n_class))
+        test_parts.append(order[:n_test])
+        train_parts.append(order[n_test:])
+    
+    return np.concatenate(train_parts), np.concatenate(test_parts)
+
+# ============================================
+# Feature Scaling
+# ============================================
+
+def standardize_features(X_train, X_test):
+    """
+    Standardize features using the training set mean and standard deviation
+    
+    The training array is scaled in place; the returned StandardScaler holds
+    the same statistics so it can be saved and reused for inference.
+    
+    Parameters:
+    -----------
+    X_train : ndarray
+        Training features (modified in place)
+    X_test : ndarray
+        Test features
+        
+    Returns:
+    --------
+    tuple : (X_train_scaled, X_test_scaled, scaler)
+    """
+    mean = X_train.mean(axis=0)
+    std = X_train.std(axis=0)
+    scale = np.where(std == 0, 1.0, std).astype(X_train.dtype)
+    
+    X_train -= mean
+    X_train /= scale
+    X_test_scaled = (X_test - mean) / scale
+    
+    # Expose the statistics through a fitted StandardScaler
+    scaler = StandardScaler()
+    scaler.mean_ = mean.astype(np.float64)
+    scaler.scale_ = scale.astype(np.float64)
+    scaler.var_ = std.astype(np.float64) ** 2
+    scaler.n_features_in_ = X_train.shape[1]
+    scaler.n_samples_seen_ = X_train.shape[0]
+    
+    return X_train, X_test_scaled, scaler
+
 # ============================================
 # Model Training
 # ============================================
 
+def _fit_subforest(X_train, y_train, n_estimators, seed):
+    """
+    Fit an independent Random Forest with a share of the trees
+    
+    Parameters:
+    -----------
+    X_train : array-like
+        Training features
+    y_train : array-like
+        Training labels
+    n_estimators : int
+        Number of trees in this sub-forest
+    seed : int
+        Random seed for this sub-forest
+        
+    Returns:
+    --------
+    RandomForestClassifier : Fitted sub-forest
+    """
+    model = RandomForestClassifier(
+        n_estimators=n_estimators,
+        max_depth=MAX_DEPTH,
+        max_features=MAX_FEATURES,
+        random_state=seed,
+        n_jobs=1,
+        verbose=0
+    )
+    return model.fit(X_train, y_train)
+
+def _uses_subforests():
+    """
+    Whether the forest is built from combined sub-forests (stock scikit-learn)
+    """
+    return RandomForestClassifier.__module__.startswith('sklearn.')
+
+def _subforest_seeds():
+    """
+    Random seeds of the sub-forests, derived from RANDOM_STATE
+    """
+    return [int(seed) for seed in np.random.SeedSequence(RANDOM_STATE).generate_state(N_SUBFORESTS)]
+
 def train_model(X_train, y_train):
     """
     Train Random Forest classifier
     
+    With stock scikit-learn the forest is built as independent sub-forests in
+    separate processes (joblib loky backend) whose trees are then combined
+    into one model. Patched estimators (sklearnex) predict from their own
+    backend model rather than estimators_, so they are fit as a single forest
+    and parallelized internally.
+    
     Parameters:
     -----------
     X_train : array-like
@@ -226,23 +435,53 @@ def train_model(X_train, y_train):
     print("Training Random Forest Classifier")
     print("=" * 60)
     
+    use_subforests = _uses_subforests()
+    
+    # One core per unit of work at most; extra workers would sit idle
+    n_jobs = min(N_SUBFORESTS if use_subforests else N_ESTIMATORS, os.cpu_count() or 1)
+    
     print("Model parameters:")
-    print(f"  - n_estimators: 100")
-    print(f"  - max_depth: 10")
+    print(f"  - n_estimators: {N_ESTIMATORS}")
+    print(f"  - max_depth: {MAX_DEPTH}")
+    print(f"  - max_features: {MAX_FEATURES}")
     print(f"  - random_state: {RANDOM_STATE}")
+    print(f"  - n_jobs: {n_jobs}")
     
-    # Initialize model
-    model = RandomForestClassifier(
-        n_estimators=100,
-        max_depth=10,
-        random_state=RANDOM_STATE,
-        n_jobs=-1,  # Use all available cores
-        verbose=1
+    print("\nTraining in progress...")
+    
+    if not use_subforests:
+        model = RandomForestClassifier(
+            n_estimators=N_ESTIMATORS,
+            max_depth=MAX_DEPTH,
+            max_features=MAX_FEATURES,
+            random_state=RANDOM_STATE,
+            n_jobs=n_jobs,
+            verbose=0
+        )
+        model.fit(X_train, y_train)
+        print("✓ Model training completed!")
+        return model
+    
+    # Split the trees into a fixed number of sub-forests, one seed each;
+    # only the number of workers running them depends on the host
+    base, extra = divmod(N_ESTIMATORS, N_SUBFORESTS)
+    chunk_sizes = [base + (i < extra) for i in range(N_SUBFORESTS)]
+    seeds = _subforest_seeds()
+    
+    # Train sub-forests in separate processes
+    subforests = Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_fit_subforest)(X_train, y_train, n_trees, seed)
+        for n_trees, seed in zip(chunk_sizes, seeds)
     )
     
-    # Train model
-    print("\nTraining in progress...")
-    model.fit(X_train, y_train)
+    # Combine the trees into a single forest
+    model = subforests[0]
+    for subforest in subforests[1:]:
+        model.estimators_ += subforest.estimators_
+    model.n_estimators = len(model.estimators_)
+    
+    # Sub-forests were fit single-threaded; predict on all available cores
+    model.n_jobs = -1
     
     print("✓ Model training completed!")
     
@@ -276,11 +515,13 @@ def evaluate_model(model, X_test, y_test):
     y_pred = model.predict(X_test)
     y_pred_proba = model.predict_proba(X_test)[:, 1]
     
-    # Calculate metrics
-    accuracy = accuracy_score(y_test, y_pred)
-    precision = precision_score(y_test, y_pred)
-    recall = recall_score(y_test, y_pred)
-    f1 = f1_score(y_test, y_pred)
+    # Derive all metrics from a single confusion matrix
+    cm = confusion_matrix(y_test, y_pred, labels=[0, 1])
+    tn, fp, fn, tp = cm.ravel()
+    accuracy = (tp + tn) / cm.sum()
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
     
     # Print metrics
     print(f"\nModel Performance Metrics:")
@@ -290,7 +531,6 @@ def evaluate_model(model, X_test, y_test):
     print(f"  F1-Score:  {f1:.4f}")
     
     # Confusion matrix
-    cm = confusion_matrix(y_test, y_pred)
     print(f"\nConfusion Matrix:")
     print(f"                Predicted")
     print(f"              Normal  Overloaded")
@@ -311,6 +551,105 @@ def evaluate_model(model, X_test, y_test):
     
     return metrics
 
+# ============================================
+# ONNX Export
+# ============================================
+
+def export_onnx_model(model, n_features):
+    """
+    Export the trained model to ONNX for batched inference with ONNX Runtime
+    
+    Parameters:
+    -----------
+    model : Trained model
+    n_features : int
+        Number of input features
+        
+    Returns:
+    --------
+    str or None : Path of the exported model, None if skl2onnx is not installed
+        or has no converter for the model type (e.g. sklearnex estimators)
+    """
+    if to_onnx is None:
+        print("skl2onnx not installed, skipping ONNX export")
+        return None
+    
+    print(f"Exporting ONNX model to {ONNX_MODEL_FILE}...")
+    try:
+        onx = to_onnx(
+            model,
+            np.zeros((1, n_features), dtype=np.float32),
+            options={'zipmap': False}  # Return probabilities as a plain tensor
+        )
+    except (MissingConverter, MissingShapeCalculator):
+        print(f"No ONNX converter for {type(model).__module__}.{type(model).__name__}, skipping ONNX export")
+        return None
+    with open(ONNX_MODEL_FILE, 'wb') as f:
+        f.write(onx.SerializeToString())
+    print(f"✓ ONNX model exported successfully!")
+    
+    return ONNX_MODEL_FILE
+
+def create_onnx_session(model_path):
+    """
+    Create an ONNX Runtime inference session for an exported model
+    
+    Parameters:
+    -----------
+    model_path : str or None
+        Path of the exported ONNX model
+        
+    Returns:
+    --------
+    InferenceSession or None : None if onnxruntime is not installed or there is no model
+    """
+    if ort is None or model_path is None:
+        return None
+    
+    return ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+
+# ============================================
+# C Code Export
+# ============================================
+
+def export_c_model(model, feature_names):
+    """
+    Export the trained model as a standalone C function
+    
+    The generated predict_overload(double *input, double *output) unrolls every
+    tree into nested comparisons. input holds the standardized features (see
+    scaler) and output receives the probabilities for (normal, overloaded).
+    
+    Parameters:
+    -----------
+    model : Trained model
+    feature_names : list
+        List of feature names, in input order
+        
+    Returns:
+    --------
+    str or None : Path of the generated source, None if m2cgen is not installed
+        or does not support the model type (e.g. sklearnex estimators)
+    """
+    if m2c is None:
+        print("m2cgen not installed, skipping C export")
+        return None
+    
+    print(f"Exporting C model to {C_MODEL_FILE}...")
+    try:
+        code = m2c.export_to_c(model, function_name='predict_overload')
+    except NotImplementedError:
+        print(f"m2cgen does not support {type(model).__module__}.{type(model).__name__}, skipping C export")
+        return None
+    with open(C_MODEL_FILE, 'w') as f:
+        f.write(f"/* Vehicle Overload Detection model, generated by train_model.py\n")
+        f.write(f" * Input (standardized): {', '.join(feature_names)}\n")
+        f.write(f" * Output: probabilities for (normal, overloaded) */\n")
+        f.write(code)
+    print(f"✓ C model exported successfully!")
+    
+    return C_MODEL_FILE
+
 # ============================================
 # Save Model and Artifacts
 # ============================================
@@ -327,6 +666,13 @@ def save_model_artifacts(model, scaler, feature_names, metrics):
         List of feature names
     metrics : dict
         Evaluation metrics
+    
+    Artifacts are written compressed with pickle protocol 5; joblib.load
+    detects the compression automatically.
+        
+    Returns:
+    --------
+    str or None : Path of the exported ONNX model, if any
     """
     print("\n" + "=" * 60)
     print("Saving Model Artifacts")
@@ -335,28 +681,45 @@ def save_model_artifacts(model, scaler, feature_names, metrics):
     try:
         # Save model
         print(f"Saving model to {MODEL_FILE}...")
-        joblib.dump(model, MODEL_FILE)
+        joblib.dump(model, MODEL_FILE, compress=ARTIFACT_COMPRESSION, protocol=5)
         print(f"✓ Model saved successfully!")
         
         # Save scaler
         print(f"Saving scaler to {SCALER_FILE}...")
-        joblib.dump(scaler, SCALER_FILE)
+        joblib.dump(scaler, SCALER_FILE, compress=ARTIFACT_COMPRESSION, protocol=5)
         print(f"✓ Scaler saved successfully!")
         
+        # Export model to ONNX
+        onnx_model_file = export_onnx_model(model, len(feature_names))
+        
+        # Export model to C
+        c_model_file = export_c_model(model, feature_names)
+        
         # Save model configuration
+        model_parameters = {
+            'n_estimators': N_ESTIMATORS,
+            'max_depth': MAX_DEPTH,
+            'max_features': MAX_FEATURES,
+            'random_state': RANDOM_STATE
+        }
+        if _uses_subforests():
+            # The forest combines sub-forests seeded from random_state, so it is
+            # not the same as a single forest fitted with random_state
+            model_parameters['n_subforests'] = N_SUBFORESTS
+            model_parameters['subforest_seeds'] = _subforest_seeds()
+        
         config = {
             'model_name': 'Vehicle Overload Detection',
             'model_version': '1.0.0',
             'model_type': 'RandomForestClassifier',
-            'model_parameters': {
-                'n_estimators': 100,
-                'max_depth': 10,
-                'random_state': RANDOM_STATE
-            },
+            'model_parameters': model_parameters,
             'feature_names': feature_names,
             'training_date': datetime.now().isoformat(),
             'evaluation_metrics': metrics,
-            'scaler_type': 'StandardScaler'
+            'scaler_type': 'StandardScaler',
+            'artifact_compression': ARTIFACT_COMPRESSION[0],
+            'onnx_model_file': onnx_model_file,
+            'c_model_file': c_model_file
         }
         
         print(f"Saving configuration to {CONFIG_FILE}...")
@@ -368,6 +731,12 @@ def save_model_artifacts(model, scaler, feature_names, metrics):
         print(f"  - Model: {MODEL_FILE}")
         print(f"  - Scaler: {SCALER_FILE}")
         print(f"  - Config: {CONFIG_FILE}")
+        if onnx_model_file:
+            print(f"  - ONNX Model: {onnx_model_file}")
+        if c_model_file:
+            print(f"  - C Model: {c_model_file}")
+        
+        return onnx_model_file
         
     except Exception as e:
         print(f"✗ Error saving artifacts: {str(e)}")
@@ -377,7 +746,7 @@ def save_model_artifacts(model, scaler, feature_names, metrics):
 # Test Predictions
 # ============================================
 
-def test_predictions(model, scaler, feature_names):
+def test_predictions(model, scaler, feature_names, onnx_session=None):
     """
     Generate predictions on test cases
     
@@ -387,86 +756,53 @@ def test_predictions(model, scaler, feature_names):
     scaler : Fitted scaler
     feature_names : list
         List of feature names
+    onnx_session : InferenceSession, optional
+        ONNX Runtime session for the exported model; used instead of the
+        scikit-learn model when given
     """
     print("\n" + "=" * 60)
     print("Testing Model Predictions")
     print("=" * 60)
     
     # Test cases
-    test_cases = [
-        {
-            'name': 'Normal Vehicle',
-            'current_load': 8.0,
-            'max_load': 12.0,
-            'suspension': 85,
-            'tire_pressure': 32,
-            'weight': 5000,
-            'speed': 60
-        },
-        {
-            'name': 'Slightly Overloaded',
-            'current_load': 13.0,
-            'max_load': 12.0,
-            'suspension': 70,
-            'tire_pressure': 30,
-            'weight': 6000,
-            'speed': 75
-        },
-        {
-            'name': 'Severely Overloaded',
-            'current_load': 18.0,
-            'max_load': 12.0,
-            'suspension': 40,
-            'tire_pressure': 25,
-            'weight': 8000,
-            'speed': 90
-        },
-        {
-            'name': 'Borderline Case',
-            'current_load': 11.5,
-            'max_load': 12.0,
-            'suspension': 65,
-            'tire_pressure': 28,
-            'weight': 5500,
-            'speed': 70
-        }
-    ]
+    test_case_names = ['Normal Vehicle', 'Slightly Overloaded', 'Severely Overloaded', 'Borderline Case']
+    features = np.array([
+        # current_load, max_load, load_ratio, suspension, tire_pressure, weight, speed
+        [8.0, 12.0, 0.0, 85, 32, 5000, 60],
+        [13.0, 12.0, 0.0, 70, 30, 6000, 75],
+        [18.0, 12.0, 0.0, 40, 25, 8000, 90],
+        [11.5, 12.0, 0.0, 65, 28, 5500, 70]
+    ], dtype=np.float32)
+    
+    # Calculate load_ratio for all test cases at once
+    features[:, LOAD_RATIO_COL] = features[:, CURRENT_LOAD_COL] / features[:, MAX_LOAD_COL] * 100.0
     
     print("\nTest Case Predictions:")
     print("-" * 60)
     
-    for i, test_case in enumerate(test_cases, 1):
-        # Calculate load_ratio
-        load_ratio = (test_case['current_load'] / test_case['max_load']) * 100
-        
-        # Prepare features in correct order
-        features = np.array([[
-            test_case['current_load'],
-            test_case['max_load'],
-            load_ratio,
-            test_case['suspension'],
-            test_case['tire_pressure'],
-            test_case['weight'],
-            test_case['speed']
-        ]])
-        
-        # Scale features
-        features_scaled = scaler.transform(features)
-        
-        # Make prediction
-        prediction = model.predict(features_scaled)[0]
-        probability = model.predict_proba(features_scaled)[0]
-        
+    # Scale features and predict the whole batch at once
+    features_scaled = scaler.transform(features).astype(np.float32, copy=False)
+    if onnx_session is not None:
+        print("Inference backend: ONNX Runtime")
+        input_name = onnx_session.get_inputs()[0].name
+        probabilities = onnx_session.run(['probabilities'], {input_name: features_scaled})[0]
+    else:
+        print("Inference backend: scikit-learn")
+        probabilities = model.predict_proba(features_scaled)
+    predictions = model.classes_[np.argmax(probabilities, axis=1)]
+    
+    for i, (name, row, prediction, probability) in enumerate(
+            zip(test_case_names, features, predictions, probabilities), 1):
         # Print results
-        print(f"\nTest Case {i}: {test_case['name']}")
+        print(f"\nTest Case {i}: {name}")
         print(f"  Features:")
-        print(f"    Current Load: {test_case['current_load']:.2f} tons")
-        print(f"    Max Load: {test_case['max_load']:.2f} tons")
-        print(f"    Load Ratio: {load_ratio:.2f}%")
-        print(f"    Suspension: {test_case['suspension']}%")
-        print(f"    Tire Pressure: {test_case['tire_pressure']} PSI")
-        print(f"    Weight: {test_case['weight']} kg")
-        print(f"    Speed: {test_case['speed']} km/h")
+        print(f"    Current Load: {row[CURRENT_LOAD_COL]:.2f} tons")
+        print(f"    Max Load: {row[MAX_LOAD_COL]:.2f} tons")
+        print(f"    Load Ratio: {row[LOAD_RATIO_COL]:.2f}%")
+        print(f"    Suspension: {row[SUSPENSION_COL]:.0f}%")
+        print(f"    Tire Pressure: {row[TIRE_PRESSURE_COL]:.0f} PSI")
+        print(f"    Weight: {row[WEIGHT_COL]:.0f} kg")
+        print(f"    Speed: {row[SPEED_COL]:.0f} km/h")
         print(f"  Prediction: {'OVERLOADED' if prediction == 1 else 'NORMAL'}")
         print(f"  Confidence: {probability[1]*100:.2f}% (overloaded), {probability[0]*100:.2f}% (normal)")
 
@@ -484,40 +820,43 @@ def main():
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
+        # Single random stream for the whole pipeline
+        rng = np.random.default_rng(RANDOM_STATE)
+        
         # Step 1: Create synthetic dataset
-        df = create_synthetic_dataset(N_SAMPLES)
+        X, y = create_synthetic_dataset(N_SAMPLES, rng)
         
         # Step 2: Validate data
-        validate_data(df)
+        validate_data(X, y)
         
         # Step 3: Prepare features and labels
         print("\n" + "=" * 60)
         print("Preparing Features and Labels")
         print("=" * 60)
         
-        feature_names = ['current_load', 'max_load', 'load_ratio', 'suspension', 
-                        'tire_pressure', 'weight', 'speed']
+        feature_names = FEATURE_NAMES
         
-        X = df[feature_names].values
-        y = df['is_overloaded'].values
+        # Keep compact dtypes through splitting, scaling and training
+        # (RandomForest works on float32 natively, so nothing is upcast)
+        X = X.astype(np.float32, copy=False)
+        y = y.astype(np.int8, copy=False)
         
-        print(f"Features shape: {X.shape}")
-        print(f"Labels shape: {y.shape}")
+        print(f"Features shape: {X.shape} ({X.dtype})")
+        print(f"Labels shape: {y.shape} ({y.dtype})")
         
         # Step 4: Split data
         print(f"\nSplitting data (train: {int((1-TEST_SIZE)*100)}%, test: {int(TEST_SIZE*100)}%)...")
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=y
-        )
+        n_normal = np.count_nonzero(y == 0)
+        train_idx, test_idx = balanced_split(y, n_normal, TEST_SIZE, rng)
+        X_train, X_test = X[train_idx], X[test_idx]
+        y_train, y_test = y[train_idx], y[test_idx]
         
         print(f"Training set: {X_train.shape[0]} samples")
         print(f"Test set: {X_test.shape[0]} samples")
         
         # Step 5: Normalize data
         print("\nNormalizing data using StandardScaler...")
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        X_train_scaled, X_test_scaled, scaler = standardize_features(X_train, X_test)
         print("✓ Data normalization completed!")
         
         # Step 6: Train model
@@ -527,10 +866,10 @@ def main():
         metrics = evaluate_model(model, X_test_scaled, y_test)
         
         # Step 8: Save artifacts
-        save_model_artifacts(model, scaler, feature_names, metrics)
+        onnx_model_file = save_model_artifacts(model, scaler, feature_names, metrics)
         
         # Step 9: Test predictions
-        test_predictions(model, scaler, feature_names)
+        test_predictions(model, scaler, feature_names, create_onnx_session(onnx_model_file))
         
         print("\n" + "=" * 60)
         print("Training Pipeline Completed Successfully!")